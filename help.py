@@ -2,10 +2,17 @@
 # -*- coding: utf-8 -*-
 
 import collections
+import re
 from BaseHTTPServer import BaseHTTPRequestHandler,HTTPServer
 
 PORT_NUMBER = 8080
 
+SPACE_RUN = re.compile(' {2,}')
+
+PROFANITY = frozenset(["shit", "fuck", "fucking","damn", "bitch", "tits", "screwed", "hell", "piss", "bastard", "shut up", "stupid", "ass"])
+THREAT = frozenset(['leave', 'quit', 'abandon'])
+FAMILY = frozenset(["family", "kids", "kid", "child", "children", "husband", "mom", "mother"])
+
 #This class will handles any incoming request from
 #the browser 
 class myHandler(BaseHTTPRequestHandler):
@@ -19,11 +26,8 @@ class myHandler(BaseHTTPRequestHandler):
 
 		f.close()
 
-		for c in range(0, len(contents) - 1):
-			um = contents[c] + contents[c+1]
-
-			if um == '  ':
-				cList.append(um)
+		for run in SPACE_RUN.findall(contents):
+			cList.extend(['  '] * (len(run) - 1))
 
 		return cList
 
@@ -44,46 +48,34 @@ class myHandler(BaseHTTPRequestHandler):
 			return "Nice job avoiding using the common filler word 'like'!"
 
 	def check_profanity(self, cList):
-		profanity = ["shit", "fuck", "fucking","damn", "bitch", "tits", "screwed", "hell", "piss", "bastard", "shut up", "stupid", "ass"]
-		for elem in cList:
-			if elem in profanity:
-				return "Please refrain from using profanity while negotiating."
+		if not PROFANITY.isdisjoint(cList):
+			return "Please refrain from using profanity while negotiating."
 		return "Your language is appropriate for this conversation."
 
 	def check_threat(self, cList):
-		threat =  ['leave', 'quit', 'abandon']
-		for elem in cList:
-			if elem in threat:
-				return "We advise that you are more positive in your conversation instead of threatening to quit."
+		if not THREAT.isdisjoint(cList):
+			return "We advise that you are more positive in your conversation instead of threatening to quit."
 							
 		return "Good job in staying positive!"
 
 	def check_fam(self, cList):
-		num = 0
-		fam = ["family", "kids", "kid", "child", "children", "husband", "mom", "mother"]
-		for elem in fam:
-			if elem in cList:
-				num += 1
+		num = len(FAMILY.intersection(cList))
 		if num >= 0.05 * len(cList):
 			return "Family is important, but we want to hear about your achievements and goals!"
 		else:
 			return "You sound very self-motivated and confident!"
 
 	def judge(self, cList):
-		counter = collections.Counter()
-		response = ""
-
-		for c in cList:
-			counter[c] += 1
+		counter = collections.Counter(cList)
 		print counter.most_common()
 
-		response += self.check_ums(counter, cList)
-		response += '\n' + self.check_likes(counter, cList)
-		response += '\n' + self.check_profanity(cList)
-		response += '\n' + self.check_threat(cList)
-		response += '\n' + self.check_fam(cList)
-
-		return response
+		return '\n'.join([
+			self.check_ums(counter, cList),
+			self.check_likes(counter, cList),
+			self.check_profanity(cList),
+			self.check_threat(cList),
+			self.check_fam(cList),
+		])
 
 
 	#Handler for the GET requests